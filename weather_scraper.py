@@ -1,16 +1,153 @@
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+import copy
 import re
+import threading
+from collections import OrderedDict
 import time
+from urllib.parse import quote, urlsplit, urlunsplit
+from concurrent.futures import ThreadPoolExecutor
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
+_ACCUWEATHER_URL = "https://www.accuweather.com/en/{}"
+
+# Shared session for Nominatim and weather.gov: one pooled keep-alive connection per host instead of a handshake per call
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "WeatherDashboard/1.0"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20,
+                                       max_retries=Retry(total=3, backoff_factor=0.3)))
+
+# JavaScript arrays the graphical forecast page embeds its hourly series in
+_HOURLY_TEMP_RE = re.compile(r'var temp = \[(.*?)\];')
+_HOURLY_WSPD_RE = re.compile(r'var wspd = \[(.*?)\];')
+_HOURLY_RH_RE = re.compile(r'var rh = \[(.*?)\];')
+_HOURLY_HOUR_RE = re.compile(r'var hour = \[(.*?)\];')
+
+# Coordinates for the most-queried US cities, keyed by normalized "city, st", so they are answered without a Nominatim round trip
+_KNOWN_COORDINATES = {
+    "salt lake city, ut": ("40.7596198", "-111.8867975"),
+    "new york, ny": ("40.7127281", "-74.0060152"),
+    "los angeles, ca": ("34.0536909", "-118.242766"),
+    "chicago, il": ("41.8755616", "-87.6244212"),
+    "houston, tx": ("29.7589382", "-95.3676974"),
+    "phoenix, az": ("33.4484367", "-112.074141"),
+    "philadelphia, pa": ("39.9527237", "-75.1635262"),
+    "san antonio, tx": ("29.4246002", "-98.4951405"),
+    "san diego, ca": ("32.7174202", "-117.1627728"),
+    "dallas, tx": ("32.7762719", "-96.7968559"),
+    "austin, tx": ("30.2711286", "-97.7436995"),
+    "san francisco, ca": ("37.7792588", "-122.4193286"),
+    "seattle, wa": ("47.6038321", "-122.330062"),
+    "denver, co": ("39.7392364", "-104.984862"),
+    "boston, ma": ("42.3554334", "-71.060511"),
+    "miami, fl": ("25.7741728", "-80.19362"),
+    "atlanta, ga": ("33.7489924", "-84.3902644"),
+    "las vegas, nv": ("36.1672559", "-115.148516"),
+    "portland, or": ("45.5202471", "-122.674194"),
+    "minneapolis, mn": ("44.9772995", "-93.2654692"),
+}
+
+# Nominatim's usage policy allows at most one request per second; calls are spaced from the last one instead of always sleeping
+_NOMINATIM_INTERVAL = 1.0
+_NOMINATIM_LOCK = threading.Lock()
+_last_nominatim_ts = 0.0
+
+def _wait_for_nominatim_slot():
+    """
+    Block until at least _NOMINATIM_INTERVAL seconds have passed since the previous Nominatim request.
+    """
+    global _last_nominatim_ts
+    with _NOMINATIM_LOCK:
+        wait = _NOMINATIM_INTERVAL - (time.monotonic() - _last_nominatim_ts)
+        if wait > 0:
+            time.sleep(wait)
+        _last_nominatim_ts = time.monotonic()
+
+# Revalidated weather.gov pages: (parser name, url) -> (ETag, Last-Modified, parsed result), least recently used first
+_CONDITIONAL_CACHE = OrderedDict()
+_CONDITIONAL_CACHE_SIZE = 64
+_CONDITIONAL_LOCK = threading.Lock()
+
+def _get_parsed(url, parse, headers=None):
+    """
+    GET a page and return parse(page bytes), revalidating with ETag/Last-Modified.
+    On 304 Not Modified the earlier parsed result is reused, so the page is neither downloaded nor parsed again.
+    Results are copied in and out of the cache, so callers may mutate what they get.
+    """
+    key = (parse.__name__, url)
+    with _CONDITIONAL_LOCK:
+        cached = _CONDITIONAL_CACHE.get(key)
+    request_headers = dict(headers or {})
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            request_headers["If-None-Match"] = etag
+        if last_modified:
+            request_headers["If-Modified-Since"] = last_modified
+    resp = _SESSION.get(url, headers=request_headers, timeout=10)
+    if resp.status_code == 304 and cached:
+        with _CONDITIONAL_LOCK:
+            if key in _CONDITIONAL_CACHE:
+                _CONDITIONAL_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+    # An error page would parse to an all-N/A or empty result; raising keeps it out of every cache above this one
+    if resp.status_code != 200:
+        raise Exception(f"Request failed with status code: {resp.status_code}")
+    result = parse(resp.content)
+    etag = resp.headers.get("ETag")
+    last_modified = resp.headers.get("Last-Modified")
+    if etag or last_modified:
+        with _CONDITIONAL_LOCK:
+            _CONDITIONAL_CACHE[key] = (etag, last_modified, copy.deepcopy(result))
+            _CONDITIONAL_CACHE.move_to_end(key)
+            while len(_CONDITIONAL_CACHE) > _CONDITIONAL_CACHE_SIZE:
+                _CONDITIONAL_CACHE.popitem(last=False)
+    return result
+
+# Shared AccuWeather session: keeps connections alive between page fetches instead of a new TLS handshake each time
+_ACCUWEATHER_SESSION = requests.Session()
+_ACCUWEATHER_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
+})
+_ACCUWEATHER_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20,
+                                                   max_retries=Retry(total=2, backoff_factor=0.3)))
+# The strainer sees the raw class attribute string, so match whole class tokens within it
+_ACCUWEATHER_STRAINER = SoupStrainer("div", class_=re.compile(r"(^|\s)(display-temp|phrase|detail-item)(\s|$)"))
+
+_WEATHER_GOV_CURRENT_CLASS_RE = re.compile(r"(^|\s)myforecast-current(-lrg)?(\s|$)")
+
+def _is_weather_gov_current_tag(name, attrs):
+    # Keeps the two reading elements and the detail table (each with its children); attribute values arrive unsplit
+    classes = attrs.get("class") or ""
+    if not isinstance(classes, str):
+        classes = " ".join(classes)
+    return attrs.get("id") == "current_conditions_detail" or bool(_WEATHER_GOV_CURRENT_CLASS_RE.search(classes))
+
+_WEATHER_GOV_CURRENT_STRAINER = SoupStrainer(_is_weather_gov_current_tag)
+
+# Only <svg> elements (and their children) are built when parsing the graphical forecast
+_SVG_STRAINER = SoupStrainer("svg")
 
 def get_coordinates(location):
     """
     Convert location to coordinates using OpenStreetMap's Nominatim service
     """
+    # Nominatim ignores case and spacing, so trivially different spellings share one cache entry
+    location = " ".join(location.split()).lower()
+    known = _KNOWN_COORDINATES.get(location)
+    if known:
+        return known
+    return _geocode(location)
+
+# Kept without a ttl (see _cached_city_state in weather_app); failures raise and are not cached.
+@st.cache_data(max_entries=1024, show_spinner=False)
+def _geocode(location):
     try:
         # Format the location for the API
         formatted_location = location.replace(' ', '+')
@@ -23,8 +160,9 @@ def get_coordinates(location):
             'User-Agent': 'WeatherDashboard/1.0 (https://github.com/yourusername/weather-dashboard)'
         }
         
-        # Make the request
-        response = requests.get(url, headers=headers)
+        # Make the request, respecting Nominatim's usage policy
+        _wait_for_nominatim_slot()
+        response = _SESSION.get(url, headers=headers, timeout=10)
         
         if response.status_code != 200:
             raise Exception(f"Geocoding API request failed with status code: {response.status_code}")
@@ -39,14 +177,46 @@ def get_coordinates(location):
         lat = first_result['lat']
         lon = first_result['lon']
         
-        # Respect Nominatim's usage policy by adding a delay
-        time.sleep(1)
-        
         return lat, lon
         
     except Exception as e:
         raise Exception(f"Error getting coordinates: {str(e)}")
 
+def get_city_state_from_coords(lat, lon):
+    """
+    Reverse geocode coordinates to (city, state) with Nominatim, spaced like every other Nominatim request
+    """
+    url = f"https://nominatim.openstreetmap.org/reverse?format=json&lat={lat}&lon={lon}&zoom=10"
+    _wait_for_nominatim_slot()
+    resp = _SESSION.get(url, timeout=10)
+    data = resp.json()
+    address = data.get('address', {})
+    city = address.get('city') or address.get('town') or address.get('village') or address.get('hamlet') or ''
+    state = address.get('state') or ''
+    return city, state
+
+def _get_latest_humidity(observation_url):
+    """
+    Follow a weather.gov observationStations URL to the first station's latest observation.
+    Returns the relative humidity reading, or None when any step has no data.
+    """
+    obs_response = _SESSION.get(observation_url, timeout=10)
+    if obs_response.status_code != 200:
+        return None
+    obs_data = obs_response.json()
+    if not obs_data.get('features'):
+        return None
+    station_url = obs_data['features'][0]['id'] + '/observations/latest'
+    station_response = _SESSION.get(station_url, timeout=10)
+    if station_response.status_code != 200:
+        return None
+    station_data = station_response.json()
+    if 'properties' not in station_data:
+        return None
+    return station_data['properties'].get('relativeHumidity', {}).get('value')
+
+# Current conditions: short TTL so readings stay fresh while reruns within a minute skip all five requests
+@st.cache_data(ttl=60, max_entries=512, show_spinner=False)
 def get_weather_data(location):
     """
     Fetch current weather data for a given location from weather.gov
@@ -59,7 +229,7 @@ def get_weather_data(location):
         url = f"https://api.weather.gov/points/{lat},{lon}"
         
         # Get the forecast URL
-        response = requests.get(url)
+        response = _SESSION.get(url, timeout=10)
         if response.status_code != 200:
             raise Exception(f"API request failed with status code: {response.status_code}")
             
@@ -69,50 +239,71 @@ def get_weather_data(location):
             raise Exception("Invalid response from weather.gov API")
             
         forecast_url = data['properties']['forecast']
+        observation_url = data['properties']['observationStations']
         
-        # Get the current weather
-        forecast_response = requests.get(forecast_url)
-        if forecast_response.status_code != 200:
-            raise Exception(f"Forecast API request failed with status code: {forecast_response.status_code}")
+        # The forecast and the observation chain only depend on the points response, so fetch them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            humidity_future = executor.submit(_get_latest_humidity, observation_url)
+            forecast_response = _SESSION.get(forecast_url, timeout=10)
+            if forecast_response.status_code != 200:
+                raise Exception(f"Forecast API request failed with status code: {forecast_response.status_code}")
+                
+            forecast_data = forecast_response.json()
             
-        forecast_data = forecast_response.json()
-        
-        if 'properties' not in forecast_data or 'periods' not in forecast_data['properties']:
-            raise Exception("Invalid forecast data from weather.gov API")
+            if 'properties' not in forecast_data or 'periods' not in forecast_data['properties']:
+                raise Exception("Invalid forecast data from weather.gov API")
+                
+            # Extract current conditions
+            current_period = forecast_data['properties']['periods'][0]
             
-        # Extract current conditions
-        current_period = forecast_data['properties']['periods'][0]
-        
-        # Get detailed current conditions
-        observation_url = data['properties']['observationStations']
-        obs_response = requests.get(observation_url)
-        if obs_response.status_code == 200:
-            obs_data = obs_response.json()
-            if 'features' in obs_data and obs_data['features']:
-                station_url = obs_data['features'][0]['id'] + '/observations/latest'
-                station_response = requests.get(station_url)
-                if station_response.status_code == 200:
-                    station_data = station_response.json()
-                    if 'properties' in station_data:
-                        humidity = station_data['properties'].get('relativeHumidity', {}).get('value')
-                        if humidity is not None:
-                            return {
-                                'temperature': current_period.get('temperature', 'N/A'),
-                                'humidity': f"{humidity:.0f}%",
-                                'wind_speed': current_period.get('windSpeed', 'N/A'),
-                                'conditions': current_period.get('shortForecast', 'N/A')
-                            }
+            # Get detailed current conditions
+            humidity = humidity_future.result()
         
-        # Fallback to forecast data if observation data is not available
         return {
             'temperature': current_period.get('temperature', 'N/A'),
-            'humidity': 'N/A',  # Forecast doesn't provide humidity
+            # Fall back to N/A if observation data is not available; the forecast doesn't provide humidity
+            'humidity': f"{humidity:.0f}%" if humidity is not None else 'N/A',
             'wind_speed': current_period.get('windSpeed', 'N/A'),
             'conditions': current_period.get('shortForecast', 'N/A')
         }
     except Exception as e:
         raise Exception(f"Error fetching weather data: {str(e)}")
 
+def _map_in_script_ctx(fn, items, max_workers):
+    """
+    Return [fn(item) for item in items], computed on a thread pool, in the order of items.
+    """
+    # Workers inherit the script context so their st.cache_data lookups still hit the cache
+    with ThreadPoolExecutor(max_workers=max_workers, initializer=add_script_run_ctx,
+                            initargs=(None, get_script_run_ctx())) as executor:
+        return list(executor.map(fn, items))
+
+def get_weather_data_many(locations, max_workers=4):
+    """
+    Fetch current weather.gov data for several locations concurrently over the shared session.
+    Args:
+        locations: Iterable of location strings, e.g. for a city comparison
+        max_workers: Number of locations fetched at once; kept small to stay polite to api.weather.gov
+    Returns:
+        list of dicts in the same order as locations, as returned by get_weather_data
+    """
+    return _map_in_script_ctx(get_weather_data, locations, max_workers)
+
+def get_full_weather_bundle(location):
+    """
+    Fetch current conditions and the hourly forecast for a location in one call.
+    The location is geocoded once and both weather.gov fetches run side by side over the shared session.
+    Returns:
+        dict with 'current' (as returned by get_weather_data) and 'hourly_df' (as returned by get_hourly_forecast_weather_gov)
+    """
+    lat, lon = get_coordinates(location)
+    # get_weather_data's own geocode of the same location is a cache hit
+    current, hourly_df = _map_in_script_ctx(lambda fetch: fetch(), (
+        lambda: get_weather_data(location),
+        lambda: get_hourly_forecast_weather_gov(lat, lon),
+    ), max_workers=2)
+    return {'current': current, 'hourly_df': hourly_df}
+
 
 
 def get_weather_data_accuweather(url=None, city_slug=None):
@@ -127,15 +318,29 @@ def get_weather_data_accuweather(url=None, city_slug=None):
     if not url and not city_slug:
         raise ValueError("Must provide either url or city_slug.")
     if not url:
-        url = f"https://www.accuweather.com/en/{city_slug}"
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
-    }
+        url = _ACCUWEATHER_URL.format(quote(city_slug, safe="/"))
+    url = url.strip()
+    # Trivially different spellings of the same page share one cache entry: scheme and host are case-insensitive,
+    # but paths and queries are not, so those only lose a trailing slash
+    parts = urlsplit(url.rstrip("/"))
+    key = urlunsplit(parts._replace(scheme=parts.scheme.lower(), netloc=parts.netloc.lower()))
+    return _fetch_accuweather_current(key, _url=url)
+
+@st.cache_data(ttl=600, max_entries=512, show_spinner=False)
+def _fetch_accuweather_current(key, _url):
+    """
+    Fetch and parse the AccuWeather city page at _url. Cached per normalized key only
+    (st.cache_data skips underscore-prefixed arguments); failures raise and are not cached.
+    """
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _ACCUWEATHER_SESSION.get(_url, timeout=10)
         if response.status_code != 200:
             raise Exception(f"Failed to fetch AccuWeather page: {response.status_code}")
-        soup = BeautifulSoup(response.content, "html.parser")
+        # Consent and error pages have none of the reading markup; a byte scan is far cheaper than parsing them
+        if not any(marker in response.content for marker in (b"display-temp", b"phrase", b"detail-item")):
+            return {"temperature": "N/A", "humidity": "N/A", "wind_speed": "N/A", "conditions": "N/A"}
+        # Only the reading divs (and their children) are kept; lxml tokenizes the rest of the page in C and drops it
+        soup = BeautifulSoup(response.content, "lxml", parse_only=_ACCUWEATHER_STRAINER)
         # Temperature
         temp_div = soup.find("div", class_="display-temp")
         temperature = temp_div.text.strip() if temp_div else "N/A"
@@ -146,13 +351,20 @@ def get_weather_data_accuweather(url=None, city_slug=None):
         details = soup.find_all("div", class_="detail-item spaced-content")
         humidity = wind = "N/A"
         for item in details:
+            # Both readings found; the remaining tiles are never searched
+            if humidity != "N/A" and wind != "N/A":
+                break
             label = item.find("div", class_="label")
-            value = item.find("div", class_="value")
-            if label and value:
-                if "Humidity" in label.text:
-                    humidity = value.text.strip()
-                if "Wind" in label.text:
-                    wind = value.text.strip()
+            if not label:
+                continue
+            label_text = label.text
+            # The value div is looked up only for a tile whose label is still wanted
+            if "Humidity" in label_text and humidity == "N/A":
+                value = item.find("div", class_="value")
+                humidity = value.text.strip() if value else humidity
+            elif "Wind" in label_text and wind == "N/A":
+                value = item.find("div", class_="value")
+                wind = value.text.strip() if value else wind
         return {
             "temperature": temperature,
             "humidity": humidity,
@@ -164,6 +376,17 @@ def get_weather_data_accuweather(url=None, city_slug=None):
     except Exception as e:
         raise Exception(f"Error in get_weather_data_accuweather: {str(e)}")
 
+def get_weather_data_accuweather_many(urls, max_workers=8):
+    """
+    Scrape several AccuWeather city pages concurrently over the shared session.
+    Args:
+        urls: Iterable of full AccuWeather city URLs
+        max_workers: Number of pages fetched at once; kept within the adapter's pool_maxsize
+    Returns:
+        list of dicts in the same order as urls, as returned by get_weather_data_accuweather
+    """
+    return _map_in_script_ctx(lambda url: get_weather_data_accuweather(url=url), urls, max_workers)
+
 def get_weather_data_html_weather_gov(url):
     """
     Scrape current weather data from a weather.gov MapClick page.
@@ -175,83 +398,97 @@ def get_weather_data_html_weather_gov(url):
     headers = {
         "User-Agent": "Mozilla/5.0"
     }
-    resp = requests.get(url, headers=headers, timeout=10)
-    soup = BeautifulSoup(resp.content, "html.parser")
+    return _get_parsed(url, _parse_weather_gov_current, headers)
+
+def _parse_weather_gov_current(content):
+    # Only the current-conditions elements are built into the tree; the rest of the page is dropped while lxml tokenizes it
+    soup = BeautifulSoup(content, "lxml", parse_only=_WEATHER_GOV_CURRENT_STRAINER)
     # Temperature
     temp = soup.find(class_="myforecast-current-lrg")
     temperature = temp.text.strip() if temp else "N/A"
     # Conditions
     cond = soup.find(class_="myforecast-current")
     conditions = cond.text.strip() if cond else "N/A"
-    # Humidity and Wind (in the table) - robust extraction
-    humidity = wind = "N/A"
+    # Humidity and Wind (in the table) - one pass, stopping once both rows are found.
+    # Matched on "Wind Speed" so a later "Wind Chill" row can't stand in for the wind reading.
+    wanted = {"Humidity": None, "Wind Speed": None}
     for row in soup.select("#current_conditions_detail tr"):
         cells = row.find_all("td")
-        if len(cells) == 2:
-            label = cells[0].get_text(strip=True)
-            value = cells[1].get_text(strip=True)
-            if "Humidity" in label:
-                humidity = value
-            if "Wind" in label:
-                wind = value
+        if len(cells) != 2:
+            continue
+        label = cells[0].get_text(strip=True)
+        for key in wanted:
+            if wanted[key] is None and key in label:
+                wanted[key] = cells[1].get_text(strip=True)
+        if None not in wanted.values():
+            break
     return {
         "temperature": temperature,
-        "humidity": humidity,
-        "wind_speed": wind,
+        "humidity": wanted["Humidity"] or "N/A",
+        "wind_speed": wanted["Wind Speed"] or "N/A",
         "conditions": conditions
     }
 
+def build_weather_gov_url(lat, lon):
+    return f"https://forecast.weather.gov/MapClick.php?lat={lat}&lon={lon}"
+
 def build_weather_gov_url_from_location(location):
     lat, lon = get_coordinates(location)
-    return f"https://forecast.weather.gov/MapClick.php?lat={lat}&lon={lon}"
+    return build_weather_gov_url(lat, lon)
 
 def get_hourly_forecast_weather_gov(lat, lon):
     """
     Scrape the hourly graphical forecast from weather.gov for a given lat/lon.
     Returns a DataFrame with columns: hour, temperature, wind_speed, humidity (if available)
     """
-    import requests
-    import pandas as pd
-    from bs4 import BeautifulSoup
-
     url = f"https://forecast.weather.gov/MapClick.php?lat={lat}&lon={lon}&unit=0&lg=english&FcstType=graphical"
-    headers = {'User-Agent': 'WeatherDashboard/1.0'}
-    resp = requests.get(url, headers=headers)
-    soup = BeautifulSoup(resp.content, "html.parser")
+    return _get_parsed(url, _parse_hourly_forecast)
+
+def _int16_series(match):
+    # Each element goes through int(), so a null, decimal or quoted entry raises instead of truncating the series
+    return np.array(match.group(1).split(','), dtype=np.int16)
+
+def _parse_hourly_forecast(content):
+    soup = BeautifulSoup(content, "lxml")
 
     # Find all script tags and look for the one containing hourly data arrays
     scripts = soup.find_all('script')
-    temp_data, wind_data, hum_data, hours = [], [], [], []
+    # Parsed into int16 arrays; the readings are small whole numbers
+    temp_data = wind_data = hum_data = hours = np.empty(0, dtype=np.int16)
     for script in scripts:
         text = script.string
-        if not text:
+        # Every series is declared with 'var'; a substring scan skips the other scripts without running any regex
+        if not text or 'var ' not in text:
             continue
         # Temperature
-        temp_match = re.search(r'var temp = \[(.*?)\];', text)
+        temp_match = _HOURLY_TEMP_RE.search(text)
         if temp_match:
-            temp_data = [int(x) for x in temp_match.group(1).split(',')]
+            temp_data = _int16_series(temp_match)
         # Wind Speed
-        wind_match = re.search(r'var wspd = \[(.*?)\];', text)
+        wind_match = _HOURLY_WSPD_RE.search(text)
         if wind_match:
-            wind_data = [int(x) for x in wind_match.group(1).split(',')]
+            wind_data = _int16_series(wind_match)
         # Humidity
-        hum_match = re.search(r'var rh = \[(.*?)\];', text)
+        hum_match = _HOURLY_RH_RE.search(text)
         if hum_match:
-            hum_data = [int(x) for x in hum_match.group(1).split(',')]
+            hum_data = _int16_series(hum_match)
         # Hours
-        hour_match = re.search(r'var hour = \[(.*?)\];', text)
+        hour_match = _HOURLY_HOUR_RE.search(text)
         if hour_match:
-            hours = [int(x) for x in hour_match.group(1).split(',')]
+            hours = _int16_series(hour_match)
+        # All four series found; the remaining scripts can't add anything
+        if temp_data.size and wind_data.size and hum_data.size and hours.size:
+            break
     # If no hours, fallback to 0..N
-    if not hours and temp_data:
-        hours = list(range(len(temp_data)))
+    if not hours.size and temp_data.size:
+        hours = np.arange(len(temp_data))
     # Build DataFrame
     df = pd.DataFrame({'hour': hours})
-    if temp_data:
+    if temp_data.size:
         df['temperature'] = temp_data
-    if wind_data:
+    if wind_data.size:
         df['wind_speed'] = wind_data
-    if hum_data:
+    if hum_data.size:
         df['humidity'] = hum_data
     return df
 
@@ -260,14 +497,12 @@ def get_hourly_forecast_svg_weather_gov(lat, lon):
     Scrape the SVG charts from weather.gov's graphical forecast for a given lat/lon.
     Returns a DataFrame with columns: hour, temperature, wind_speed, humidity (if available)
     """
-    import requests
-    import pandas as pd
-    from bs4 import BeautifulSoup
-
     url = f"https://forecast.weather.gov/MapClick.php?lat={lat}&lon={lon}&unit=0&lg=english&FcstType=graphical"
-    headers = {'User-Agent': 'WeatherDashboard/1.0'}
-    resp = requests.get(url, headers=headers)
-    soup = BeautifulSoup(resp.content, "html.parser")
+    return _get_parsed(url, _parse_hourly_forecast_svg)
+
+def _parse_hourly_forecast_svg(content):
+    # Only the charts are built into the tree; lxml tokenizes the rest of the page in C and drops it
+    soup = BeautifulSoup(content, "lxml", parse_only=_SVG_STRAINER)
 
     # Find all SVGs (each chart is an SVG)
     svgs = soup.find_all('svg')
@@ -285,7 +520,7 @@ def get_hourly_forecast_svg_weather_gov(lat, lon):
                     numbers.append(float(val))
             except Exception:
                 continue
-        return numbers
+        return np.array(numbers, dtype=np.float32)
 
     # Extract data from the first three SVGs
     temp_vals = extract_svg_numbers(svgs[0])
@@ -311,6 +546,16 @@ def get_hourly_forecast_svg_weather_gov(lat, lon):
     })
     return df
 
+def get_digital_forecast_html(lat, lon):
+    """
+    Fetch the raw weather.gov digital forecast page for a given lat/lon over the shared session.
+    Raises on an error response, so callers never cache an error page.
+    """
+    url = f"https://forecast.weather.gov/MapClick.php?lat={lat}&lon={lon}&lg=english&&FcstType=digital"
+    resp = _SESSION.get(url, timeout=10)
+    resp.raise_for_status()
+    return resp.content
+
 def get_digital_forecast_table_weather_gov(lat, lon):
     """
     Scrape the digital forecast table from weather.gov for a given lat/lon.